@@ -28,12 +28,16 @@ from traitlets import Instance
 from traitlets import Integer
 from traitlets import List
 from traitlets import TraitError
+from traitlets import Type
 from traitlets import Unicode
 from traitlets import validate
 
 from jupyter_server._tz import isoformat
 from jupyter_server._tz import utcnow
 from jupyter_server.prometheus.metrics import KERNEL_CURRENTLY_RUNNING_TOTAL
+from jupyter_server.services.kernels.monitor import KernelLivenessMonitor
+from jupyter_server.services.kernels.placement import kernel_pid
+from jupyter_server.services.kernels.placement import KernelPlacementPolicy
 from jupyter_server.utils import ensure_async
 from jupyter_server.utils import to_os_path
 
@@ -57,6 +61,8 @@ class MappingKernelManager(MultiKernelManager):
 
     _kernel_ports = Dict()
 
+    _kernel_cpus = Dict()
+
     _culler_callback = None
 
     _initialized_culler = False
@@ -135,6 +141,52 @@ class MappingKernelManager(MultiKernelManager):
         """,
     )
 
+    kernel_placement_class = Type(
+        default_value=KernelPlacementPolicy,
+        klass=KernelPlacementPolicy,
+        config=True,
+        help="""The placement policy used to assign CPUs to local kernels.
+
+        The default policy leaves placement to the OS scheduler.  Use
+        jupyter_server.services.kernels.placement.LoadBalancedPlacementPolicy
+        to spread kernels across NUMA nodes and cores by current load.
+        """,
+    )
+
+    placement_policy = Instance(KernelPlacementPolicy)
+
+    @default("placement_policy")
+    def _default_placement_policy(self):
+        return self.kernel_placement_class(parent=self, log=self.log)
+
+    use_liveness_monitor = Bool(
+        True,
+        config=True,
+        help="""Whether to watch all local kernels with a single liveness monitor.
+
+        When True, kernel restarters are driven by one shared monitor (pidfds
+        where available, one batched poll otherwise) instead of each kernel
+        polling ``is_alive()`` on its own timer.
+        """,
+    )
+
+    liveness_monitor = Instance(KernelLivenessMonitor)
+
+    @default("liveness_monitor")
+    def _default_liveness_monitor(self):
+        return KernelLivenessMonitor(parent=self, log=self.log)
+
+    def _create_kernel_manager_factory(self):
+        create_kernel_manager = super()._create_kernel_manager_factory()
+
+        def create_monitored_kernel_manager(*args, **kwargs):
+            km = create_kernel_manager(*args, **kwargs)
+            if self.use_liveness_monitor:
+                self.liveness_monitor.adopt(km)
+            return km
+
+        return create_monitored_kernel_manager
+
     _kernel_buffers = Any()
 
     @default("_kernel_buffers")
@@ -175,6 +227,7 @@ class MappingKernelManager(MultiKernelManager):
     def _handle_kernel_died(self, kernel_id):
         """notice that a kernel died"""
         self.log.warning("Kernel %s died, removing from map.", kernel_id)
+        self._release_placement(kernel_id)
         self.remove_kernel(kernel_id)
 
     def cwd_for_path(self, path):
@@ -210,6 +263,7 @@ class MappingKernelManager(MultiKernelManager):
             kernel_id = await ensure_async(self.pinned_superclass.start_kernel(self, **kwargs))
             self._kernel_connections[kernel_id] = 0
             self._kernel_ports[kernel_id] = self._kernels[kernel_id].ports
+            self.place_kernel(kernel_id)
             self.start_watching_activity(kernel_id)
             self.log.info("Kernel started: %s" % kernel_id)
             self.log.debug("Kernel args: %r" % kwargs)
@@ -233,6 +287,33 @@ class MappingKernelManager(MultiKernelManager):
 
         return kernel_id
 
+    def place_kernel(self, kernel_id):
+        """Restrict a local kernel process to the CPUs chosen by the placement policy.
+
+        Failures are logged rather than raised: a kernel running on the
+        wrong cores is still better than no kernel at all.
+        """
+        kernel = self._kernels[kernel_id]
+        pid = kernel_pid(kernel)
+        if pid is None or not hasattr(os, "sched_setaffinity"):
+            return
+        cpus = self.placement_policy.select_cpus(kernel_id, kernel.kernel_name)
+        if not cpus:
+            return
+        try:
+            os.sched_setaffinity(pid, cpus)
+        except (OSError, ValueError) as e:
+            self.log.warning("Could not set CPU affinity of kernel %s: %s", kernel_id, e)
+            self.placement_policy.release(kernel_id)
+            self._kernel_cpus.pop(kernel_id, None)
+            return
+        self._kernel_cpus[kernel_id] = cpus
+        self.log.debug("Kernel %s placed on CPUs %s", kernel_id, cpus)
+
+    def _release_placement(self, kernel_id):
+        self._kernel_cpus.pop(kernel_id, None)
+        self.placement_policy.release(kernel_id)
+
     def ports_changed(self, kernel_id):
         """Used by ZMQChannelsHandler to determine how to coordinate nudge and replays.
 
@@ -377,12 +458,16 @@ class MappingKernelManager(MultiKernelManager):
         # a maintenance perspective.
         self._kernel_connections.pop(kernel_id, None)
         self._kernel_ports.pop(kernel_id, None)
+        self._release_placement(kernel_id)
 
     async def restart_kernel(self, kernel_id, now=False):
         """Restart a kernel by kernel_id"""
         self._check_kernel_id(kernel_id)
         await ensure_async(self.pinned_superclass.restart_kernel(self, kernel_id, now=now))
         kernel = self.get_kernel(kernel_id)
+        # the restarted kernel is a new process, so it needs placing again
+        self._release_placement(kernel_id)
+        self.place_kernel(kernel_id)
         # return a Future that will resolve when the kernel has successfully restarted
         channel = kernel.connect_shell()
         future = Future()
@@ -448,6 +533,8 @@ class MappingKernelManager(MultiKernelManager):
             "execution_state": kernel.execution_state,
             "connections": self._kernel_connections.get(kernel_id, 0),
         }
+        if kernel_id in self._kernel_cpus:
+            model["cpu_affinity"] = self._kernel_cpus[kernel_id]
         return model
 
     def list_kernels(self):
@@ -619,4 +706,5 @@ class AsyncMappingKernelManager(MappingKernelManager, AsyncMultiKernelManager):
         )
         self._kernel_connections.pop(kernel_id, None)
         self._kernel_ports.pop(kernel_id, None)
+        self._release_placement(kernel_id)
         return ret
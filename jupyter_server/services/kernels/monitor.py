@@ -0,0 +1,164 @@
+"""A single liveness monitor for all the kernels of a MappingKernelManager.
+
+jupyter_client gives every kernel its own restarter with its own
+``PeriodicCallback`` calling ``is_alive()``.  With many kernels that is a
+steady stream of timer wakeups on the event loop.  The monitor below keeps
+the restarters (and therefore their restart accounting and the ``restart``
+and ``dead`` callbacks registered on them) but drives them from one place:
+
+- on Linux, each local kernel process is watched with a pidfd registered
+  on the IOLoop, so a kernel exit wakes the server exactly once;
+- everything else (no pidfd support, non-local provisioners, kernels that
+  are still in their start-up window) is checked by a single batched
+  ``PeriodicCallback``.
+"""
+# Copyright (c) Jupyter Development Team.
+# Distributed under the terms of the Modified BSD License.
+import asyncio
+import os
+
+from tornado.ioloop import IOLoop
+from tornado.ioloop import PeriodicCallback
+from traitlets import Bool
+from traitlets import Float
+from traitlets.config.configurable import LoggingConfigurable
+
+from jupyter_server.services.kernels.placement import kernel_pid
+from jupyter_server.services.kernels.placement import kernel_process
+from jupyter_server.utils import ensure_async
+
+
+class MonitoredRestarterMixin:
+    """Restarter mixin that hands polling over to a KernelLivenessMonitor."""
+
+    monitor = None
+
+    def start(self):
+        self.monitor.add(self)
+
+    def stop(self):
+        self.monitor.remove(self)
+
+
+class KernelLivenessMonitor(LoggingConfigurable):
+    """Watch the processes of all kernels and poll their restarters on exit."""
+
+    poll_interval = Float(
+        3.0,
+        config=True,
+        help="""The interval (in seconds) of the batched liveness check for kernels
+        that cannot be watched with a pidfd.""",
+    )
+
+    use_pidfd = Bool(
+        True,
+        config=True,
+        help="""Whether to watch local kernel processes with pidfds (Linux 5.3+)
+        instead of polling them.""",
+    )
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._restarters = set()
+        self._pidfds = {}
+        self._checking = set()
+        self._restarter_classes = {}
+        self._callback = None
+
+    def restarter_class_for(self, restarter_class):
+        """Return a subclass of restarter_class whose polling is driven by this monitor."""
+        if restarter_class not in self._restarter_classes:
+            self._restarter_classes[restarter_class] = type(
+                "Monitored" + restarter_class.__name__,
+                (MonitoredRestarterMixin, restarter_class),
+                {"monitor": self},
+            )
+        return self._restarter_classes[restarter_class]
+
+    def adopt(self, km):
+        """Make a newly created KernelManager report to this monitor."""
+        restarter_class = getattr(km, "restarter_class", None)
+        if restarter_class is not None and not issubclass(
+            restarter_class, MonitoredRestarterMixin
+        ):
+            km.restarter_class = self.restarter_class_for(restarter_class)
+
+    def add(self, restarter):
+        """Start watching the kernel of restarter (again, after a restart)."""
+        self._disarm(restarter)
+        self._restarters.add(restarter)
+        self._arm(restarter)
+        if self._callback is None:
+            self._callback = PeriodicCallback(self.poll, 1000 * self.poll_interval)
+            self._callback.start()
+
+    def remove(self, restarter):
+        """Stop watching the kernel of restarter."""
+        self._disarm(restarter)
+        self._restarters.discard(restarter)
+        if not self._restarters and self._callback is not None:
+            self._callback.stop()
+            self._callback = None
+
+    def stop(self):
+        """Stop watching all kernels."""
+        for restarter in list(self._restarters):
+            self.remove(restarter)
+
+    def _arm(self, restarter):
+        if not self.use_pidfd or not hasattr(os, "pidfd_open"):
+            return
+        pid = kernel_pid(restarter.kernel_manager)
+        if pid is None:
+            return
+        try:
+            fd = os.pidfd_open(pid)
+        except OSError as e:
+            self.log.debug("Could not open pidfd for kernel process %s: %s", pid, e)
+            return
+        self._pidfds[restarter] = fd
+        IOLoop.current().add_handler(
+            fd, lambda fd, events: self._on_exit(restarter), IOLoop.READ
+        )
+
+    def _disarm(self, restarter):
+        fd = self._pidfds.pop(restarter, None)
+        if fd is not None:
+            IOLoop.current().remove_handler(fd)
+            os.close(fd)
+
+    def _on_exit(self, restarter):
+        self._disarm(restarter)
+        IOLoop.current().add_callback(self.check, restarter)
+
+    def _needs_poll(self, restarter):
+        # Kernels in their start-up window are polled so the restarter can
+        # track a stable start, exactly as it would with its own timer.
+        if restarter._restarting or restarter._initial_startup:
+            return True
+        if restarter in self._pidfds:
+            return False
+        process = kernel_process(restarter.kernel_manager)
+        if process is None:
+            return True
+        return process.poll() is not None
+
+    async def check(self, restarter):
+        """Let the restarter handle a (possibly) dead kernel."""
+        if restarter not in self._restarters or restarter in self._checking:
+            return
+        self._checking.add(restarter)
+        try:
+            await ensure_async(restarter.poll())
+        except Exception:
+            self.log.exception("Error polling kernel restarter %r", restarter)
+        finally:
+            self._checking.discard(restarter)
+        if restarter in self._restarters and restarter not in self._pidfds:
+            self._arm(restarter)
+
+    async def poll(self):
+        """The batched liveness check for all kernels not watched by a pidfd."""
+        pending = [r for r in list(self._restarters) if self._needs_poll(r)]
+        if pending:
+            await asyncio.gather(*(self.check(r) for r in pending))
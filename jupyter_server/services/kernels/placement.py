@@ -0,0 +1,171 @@
+"""CPU placement policies for local kernels.
+
+A placement policy decides which CPUs a newly started kernel process may run
+on.  The :class:`MappingKernelManager` consults its policy after each local
+kernel launch (and restart) and applies the result with
+``os.sched_setaffinity``.
+"""
+# Copyright (c) Jupyter Development Team.
+# Distributed under the terms of the Modified BSD License.
+import glob
+import os
+import re
+
+from traitlets import Dict
+from traitlets import Integer
+from traitlets.config.configurable import LoggingConfigurable
+
+
+def _parse_cpulist(text):
+    """Parse a kernel-style cpu list (e.g. ``0-3,8,10-11``) into a list of ints."""
+    cpus = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(part))
+    return cpus
+
+
+def kernel_process(km):
+    """Return the Popen object behind a local KernelManager, or None."""
+    provisioner = getattr(km, "provisioner", None)
+    if provisioner is not None:
+        return getattr(provisioner, "process", None)
+    return getattr(km, "kernel", None)
+
+
+def kernel_pid(km):
+    """Return the pid of the process behind a local KernelManager, or None."""
+    return getattr(kernel_process(km), "pid", None)
+
+
+class KernelPlacementPolicy(LoggingConfigurable):
+    """Base placement policy: leave kernels wherever the OS scheduler puts them.
+
+    Subclasses override :meth:`select_cpus` to return the set of CPUs a
+    kernel should be restricted to, and :meth:`release` to forget about
+    a kernel once it has been shut down.
+    """
+
+    def available_cpus(self):
+        """The CPUs this server itself is allowed to run on."""
+        if hasattr(os, "sched_getaffinity"):
+            return sorted(os.sched_getaffinity(0))
+        return list(range(os.cpu_count() or 1))
+
+    def select_cpus(self, kernel_id, kernel_name):
+        """Return a sorted list of CPUs for the kernel, or None for no restriction."""
+        return None
+
+    def release(self, kernel_id):
+        """Forget any placement recorded for kernel_id."""
+        pass
+
+
+class LoadBalancedPlacementPolicy(KernelPlacementPolicy):
+    """Spread kernels across NUMA nodes and cores by current load.
+
+    Load is measured from ``/proc/stat`` as the busy fraction of each CPU since
+    the previous placement decision, plus one unit for every kernel already
+    placed on that CPU by this policy.  A kernel is first assigned to the NUMA
+    node with the lowest mean load and then to the least loaded CPUs on that
+    node.  Kernels whose kernelspec name appears in ``pinned_cpus`` always get
+    the listed CPUs instead.
+    """
+
+    cpus_per_kernel = Integer(
+        1,
+        config=True,
+        help="""The number of CPUs each kernel is allowed to run on.""",
+    )
+
+    pinned_cpus = Dict(
+        config=True,
+        help="""Mapping of kernelspec name to a fixed list of CPUs.
+
+        Kernels started from these kernelspecs bypass load balancing and are
+        always pinned to the given CPUs, e.g. to reserve whole sockets for
+        heavy workloads.
+        """,
+    )
+
+    proc_stat_path = "/proc/stat"
+    numa_node_glob = "/sys/devices/system/node/node[0-9]*"
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._assignments = {}
+        self._last_times = {}
+        self._utilisation = {}
+
+    def numa_nodes(self):
+        """Return a list of CPU lists, one per NUMA node with available CPUs."""
+        available = set(self.available_cpus())
+        nodes = []
+        for node_dir in sorted(glob.glob(self.numa_node_glob)):
+            try:
+                with open(os.path.join(node_dir, "cpulist")) as f:
+                    cpus = [c for c in _parse_cpulist(f.read()) if c in available]
+            except (OSError, ValueError):
+                continue
+            if cpus:
+                nodes.append(cpus)
+        if not nodes:
+            nodes = [sorted(available)]
+        return nodes
+
+    def _read_cpu_times(self):
+        """Return {cpu: (busy, total)} jiffies read from /proc/stat."""
+        times = {}
+        try:
+            with open(self.proc_stat_path) as f:
+                for line in f:
+                    match = re.match(r"cpu(\d+)\s+(.*)", line)
+                    if not match:
+                        continue
+                    fields = [int(v) for v in match.group(2).split()]
+                    # idle and iowait are the 4th and 5th columns
+                    idle = sum(fields[3:5])
+                    total = sum(fields[:8])
+                    times[int(match.group(1))] = (total - idle, total)
+        except OSError:
+            pass
+        return times
+
+    def cpu_load(self):
+        """Return {cpu: load}, combining measured utilisation with placed kernels."""
+        times = self._read_cpu_times()
+        for cpu, (busy, total) in times.items():
+            last_busy, last_total = self._last_times.get(cpu, (0, 0))
+            elapsed = total - last_total
+            # keep the previous reading when no time has passed between decisions
+            if elapsed > 0:
+                self._utilisation[cpu] = (busy - last_busy) / elapsed
+        self._last_times = times
+        load = {cpu: self._utilisation.get(cpu, 0.0) for cpu in self.available_cpus()}
+        for cpus in self._assignments.values():
+            for cpu in cpus:
+                if cpu in load:
+                    load[cpu] += 1.0
+        return load
+
+    def select_cpus(self, kernel_id, kernel_name):
+        if kernel_name in self.pinned_cpus:
+            cpus = sorted(int(c) for c in self.pinned_cpus[kernel_name])
+        else:
+            load = self.cpu_load()
+            node = min(
+                self.numa_nodes(),
+                key=lambda cpus: sum(load.get(c, 0.0) for c in cpus) / len(cpus),
+            )
+            count = max(1, min(self.cpus_per_kernel, len(node)))
+            cpus = sorted(sorted(node, key=lambda c: (load.get(c, 0.0), c))[:count])
+        self._assignments[kernel_id] = cpus
+        return cpus
+
+    def release(self, kernel_id):
+        self._assignments.pop(kernel_id, None)
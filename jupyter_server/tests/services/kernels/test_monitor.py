@@ -0,0 +1,46 @@
+import asyncio
+import os
+import signal
+import sys
+
+import pytest
+
+from jupyter_server.services.kernels.monitor import MonitoredRestarterMixin
+from jupyter_server.services.kernels.placement import kernel_pid
+
+
+@pytest.fixture(params=["MappingKernelManager", "AsyncMappingKernelManager"])
+def jp_argv(request):
+    return [
+        "--ServerApp.kernel_manager_class=jupyter_server.services.kernels.kernelmanager."
+        + request.param
+    ]
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="requires SIGKILL")
+async def test_monitor_restarts_dead_kernel(jp_serverapp, jp_cleanup_subprocesses):
+    km = jp_serverapp.kernel_manager
+    km.liveness_monitor.poll_interval = 0.1
+    kernel_id = await km.start_kernel()
+    kernel = km.get_kernel(kernel_id)
+    assert isinstance(kernel._restarter, MonitoredRestarterMixin)
+    # no per-kernel timer
+    assert getattr(kernel._restarter, "_pcallback", None) is None
+    assert kernel._restarter in km.liveness_monitor._restarters
+
+    restarted = asyncio.Event()
+    km.add_restart_callback(kernel_id, restarted.set, "restart")
+    pid = kernel_pid(kernel)
+    os.kill(pid, signal.SIGKILL)
+    await asyncio.wait_for(restarted.wait(), 30)
+
+    for _ in range(100):
+        new_pid = kernel_pid(kernel)
+        if new_pid is not None and new_pid != pid:
+            break
+        await asyncio.sleep(0.1)
+    assert new_pid != pid
+    assert kernel._restarter in km.liveness_monitor._restarters
+
+    await jp_cleanup_subprocesses()
+    assert not km.liveness_monitor._restarters
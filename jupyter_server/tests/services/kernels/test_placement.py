@@ -0,0 +1,65 @@
+import os
+import sys
+
+import pytest
+
+from jupyter_server.services.kernels.placement import _parse_cpulist
+from jupyter_server.services.kernels.placement import LoadBalancedPlacementPolicy
+
+
+def test_parse_cpulist():
+    assert _parse_cpulist("0-3,8,10-11\n") == [0, 1, 2, 3, 8, 10, 11]
+    assert _parse_cpulist("") == []
+
+
+@pytest.fixture
+def policy(tmp_path, monkeypatch):
+    for node, cpus in enumerate(["0-1", "2-3"]):
+        node_dir = tmp_path / "node{}".format(node)
+        node_dir.mkdir()
+        (node_dir / "cpulist").write_text(cpus)
+    stat = tmp_path / "stat"
+    stat.write_text(
+        "cpu  0 0 0 0 0 0 0 0\n"
+        "cpu0 100 0 0 0 0 0 0 0\n"
+        "cpu1 100 0 0 0 0 0 0 0\n"
+        "cpu2 0 0 0 100 0 0 0 0\n"
+        "cpu3 0 0 0 100 0 0 0 0\n"
+    )
+    policy = LoadBalancedPlacementPolicy()
+    policy.numa_node_glob = str(tmp_path / "node[0-9]*")
+    policy.proc_stat_path = str(stat)
+    monkeypatch.setattr(policy, "available_cpus", lambda: [0, 1, 2, 3])
+    return policy
+
+
+def test_load_balanced_placement(policy):
+    # cpus 0-1 are busy, so the first kernel lands on the idle node
+    assert policy.select_cpus("a", "python3") == [2]
+    # placed kernels count as load
+    assert policy.select_cpus("b", "python3") == [3]
+    policy.release("a")
+    assert policy.select_cpus("c", "python3") == [2]
+
+
+def test_pinned_placement(policy):
+    policy.pinned_cpus = {"heavy": [0, 1]}
+    assert policy.select_cpus("a", "heavy") == [0, 1]
+    assert policy.select_cpus("b", "python3") == [2]
+
+
+def test_cpus_per_kernel(policy):
+    policy.cpus_per_kernel = 4
+    # never spans more than one NUMA node
+    assert policy.select_cpus("a", "python3") == [2, 3]
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="requires sched_setaffinity")
+async def test_kernel_model_affinity(jp_fetch, jp_serverapp, jp_cleanup_subprocesses):
+    km = jp_serverapp.kernel_manager
+    cpu = sorted(os.sched_getaffinity(0))[0]
+    km.placement_policy = LoadBalancedPlacementPolicy(pinned_cpus={"python3": [cpu]})
+    kernel_id = await km.start_kernel(kernel_name="python3")
+    model = km.kernel_model(kernel_id)
+    assert model["cpu_affinity"] == [cpu]
+    await jp_cleanup_subprocesses()